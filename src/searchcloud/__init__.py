@@ -1,12 +1,34 @@
 import argparse
+import mmap
+import os
+import queue
 import re
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import timedelta
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 from typing import Any, Generator
 
-import pyfiglet
+from builtins import print as _print
+
 from rich import print
 
+try:
+    import hyperscan
+except ImportError:  # Dependência opcional
+    hyperscan = None
+
+try:
+    import numba
+    import numpy as np
+except ImportError:  # Dependência opcional
+    numba = None
+
+from searchcloud.banner import BANNER
 from searchcloud.version import __version__
 
 # --- Globais --- #
@@ -14,6 +36,8 @@ BUFFER = False
 VERBOSO = False
 DIRETORIO_BASE = Path(__file__).parent
 DIRETORIO_CHAMADO = Path.cwd()
+# Bancos Hyperscan já compilados, por processo trabalhador
+_BANCOS_HYPERSCAN: dict[tuple[bytes, bool], Any] = {}
 
 
 # --- Tipos --- #
@@ -31,22 +55,36 @@ def tipo_extensao(valor: str) -> str:
 
 
 # --- Funções auxiliares --- #
-def formatar_duracao(segundos: float) -> str:
+def _percorrer(diretorio: str, sufixo: str) -> Generator[str, Any, None]:
     """
-    Formatar a duração em horas, minutos e segundos.
+    Percorrer um diretório recursivamente com os.scandir.
+
+    As entradas de os.scandir carregam o tipo já informado pelo sistema
+    de arquivos, evitando as chamadas stat extras que o Path.glob faz
+    para cada entrada. O sufixo é testado antes de qualquer consulta ao
+    tipo, para que entradas com outra extensão não custem nada além da
+    comparação de texto.
 
     Args:
-        segundos (float): Duração em segundos.
+        diretorio (str): Diretório a ser percorrido.
+        sufixo (str): Sufixo dos arquivos a serem buscados (ex.: ".txt").
 
-    Returns:
-        str: Duração formatada em horas, minutos e segundos.
+    Yields:
+        str: Caminho do arquivo encontrado.
     """
-    horas, remainder = divmod(int(segundos), 3600)
-    minutos, segundos = divmod(remainder, 60)
-    return f"{horas:02}:{minutos:02}:{segundos:02}"
+    try:
+        entradas = os.scandir(diretorio)
+    except OSError:
+        return
+    with entradas:
+        for entrada in entradas:
+            if entrada.name.endswith(sufixo) and entrada.is_file(follow_symlinks=False):
+                yield entrada.path
+            elif entrada.is_dir(follow_symlinks=False):
+                yield from _percorrer(entrada.path, sufixo)
 
 
-def ler_arquivos(diretorio: Path | str, extensao: str) -> list[Path]:
+def ler_arquivos(diretorio: Path | str, extensao: str) -> list[str]:
     """
     Ler arquivos de um diretorio e retornar uma lista de arquivos.
 
@@ -55,91 +93,927 @@ def ler_arquivos(diretorio: Path | str, extensao: str) -> list[Path]:
         extensao (str): Extensão dos arquivos a serem buscados.
 
     Returns:
-        list[Path]: Lista de arquivos encontrados.
+        list[str]: Lista de caminhos dos arquivos encontrados.
     """
     if not isinstance(diretorio, Path):
         diretorio = Path(diretorio)
 
     if diretorio.is_file():
-        arquivos = [diretorio]
+        arquivos = [str(diretorio)]
     else:
         print(
             f"Buscando por arquivos com extensão .{extensao} no diretório: {diretorio}"
         )
-        tmp = [
-            arq if arq.is_file() else None for arq in diretorio.glob(f"**/*.{extensao}")
-        ]
-        arquivos = list(filter(None, tmp))
+        arquivos = list(_percorrer(str(diretorio), sufixo="." + extensao))
 
     print(f"Total de arquivos encontrados: {len(arquivos)}")
     if VERBOSO:
         print("Lista de arquivos encontrados:")
+        # builtins.print: sem análise de marcação do rich por arquivo
         for arq in arquivos:
-            print(arq)
+            _print(arq)
 
     return arquivos
 
 
-def ler_arquivo(arquivo: Path) -> Generator[str, Any, None]:
+def ler_arquivo(arquivo: str) -> Generator[str, Any, None]:
     """
     Ler um arquivo e retornar uma linha de cada vez.
 
     Args:
-        arquivo (Path): Caminho para o arquivo.
+        arquivo (str): Caminho para o arquivo.
 
     Yields:
         str | None: Linha do arquivo.
     """
     try:
+        # Variante verbosa: imprime cada linha lida (builtins.print, sem a
+        # análise de marcação do rich por linha)
         if VERBOSO:
             print(f"Lendo arquivo: {arquivo}")
-
-        # Carrega o arquivo em memória
-        if BUFFER:
-            for linha in arquivo.read_text(encoding="utf-8").splitlines():
-                if VERBOSO:
-                    print(f"Leitura da linha: {linha}")
-                yield linha
-        # Carrega o arquivo linha por linha
+            # Carrega o arquivo em memória
+            if BUFFER:
+                with open(arquivo, "r", encoding="utf-8") as f:
+                    linhas = f.read().splitlines()
+                for linha in linhas:
+                    _print(f"Leitura da linha: {linha}")
+                    yield linha
+            # Carrega o arquivo linha por linha
+            else:
+                with open(arquivo, "r", encoding="utf-8") as f:
+                    for linha in f:
+                        linha = linha.strip()  # Remover espaços e quebras extras
+                        _print(f"Leitura da linha: {linha}")
+                        yield linha
+        # Variante rápida: sem teste de verbosidade a cada linha
+        elif BUFFER:
+            with open(arquivo, "r", encoding="utf-8") as f:
+                yield from f.read().splitlines()
         else:
-            with arquivo.open("r", encoding="utf-8") as f:
+            with open(arquivo, "r", encoding="utf-8") as f:
                 for linha in f:
-                    linha = linha.strip()  # Remover espaços e quebras de linha extras
-                    if VERBOSO:
-                        print(f"Leitura da linha: {linha}")
-                    yield linha
+                    yield linha.strip()  # Remover espaços e quebras extras
     except Exception as e:
         if VERBOSO:
             print(f"Erro lendo o arquivo: {e}")
         yield None
 
 
-def buscar_termo(linha: str, termo: re.Pattern) -> str | None:
+@lru_cache(maxsize=1024)
+def _obter_padrao(termo: str, flags: int = 0) -> re.Pattern:
+    """
+    Compilar um termo em um padrão re, com cache explícito.
+
+    O cache interno do re tem 512 entradas e descarta as mais antigas
+    sob pressão; este cache dedicado garante que chamadores
+    programáticos que passam termos str não recompilem a cada chamada.
+
+    Args:
+        termo (str): Termo a ser compilado.
+        flags (int): Flags de compilação do re.
+
+    Returns:
+        re.Pattern: Padrão compilado.
+    """
+    return re.compile(termo, flags)
+
+
+def buscar_termo(linha: str, termo: re.Pattern | str) -> str | None:
     """
     Buscar um termo em uma linha.
 
     Args:
         linha (str): Linha a ser pesquisada.
-        termo (re.Pattern): Termo a ser pesquisado.
+        termo (re.Pattern | str): Termo a ser pesquisado, compilado ou
+            como padrão str.
 
     Returns:
         str | None: Linha encontrada.
     """
-    if re.search(termo, string=linha):
+    if isinstance(termo, str):
+        termo = _obter_padrao(termo)
+    if termo.search(linha):
         if VERBOSO:
-            print(f"Encontrado na linha: {linha}")
+            _print(f"Encontrado na linha: {linha}")
         return linha
     else:
         return None
 
 
+def _limites_da_linha(
+    dados: str | bytes | mmap.mmap, inicio: int, fim: int
+) -> tuple[int, int]:
+    """
+    Calcular os limites da linha que contém o trecho [inicio, fim).
+
+    Apenas duas buscas por quebra de linha (rfind e find, ambas em C)
+    recuperam a linha inteira a partir dos deslocamentos de uma
+    ocorrência, qualquer que seja o motor que a encontrou.
+
+    Args:
+        dados (str | bytes | mmap.mmap): Conteúdo pesquisado.
+        inicio (int): Início da ocorrência.
+        fim (int): Fim da ocorrência.
+
+    Returns:
+        tuple[int, int]: Início e fim da linha.
+    """
+    quebra = "\n" if isinstance(dados, str) else b"\n"
+    inicio_linha = dados.rfind(quebra, 0, inicio) + 1
+    fim_linha = dados.find(quebra, fim)
+    if fim_linha == -1:
+        fim_linha = len(dados)
+    return inicio_linha, fim_linha
+
+
+def _tolerar_crlf(padrao: str) -> str:
+    """
+    Reescrever as âncoras $ de um padrão para tolerar quebras CRLF.
+
+    Com re.MULTILINE o $ casa apenas antes de \\n, nunca antes de
+    \\r\\n; a leitura linha por linha original removia o \\r antes da
+    busca e por isso aceitava os dois finais. Cada $ que atua como
+    âncora (fora de classes de caracteres e de escapes) vira \\r?$,
+    preservando o comportamento nos dois tipos de arquivo.
+
+    Args:
+        padrao (str): Padrão informado pelo usuário (já escapado, se literal).
+
+    Returns:
+        str: Padrão com as âncoras $ tolerantes a CRLF.
+    """
+    partes = []
+    classe = False
+    i = 0
+    while i < len(padrao):
+        caractere = padrao[i]
+        # Escapes (\$, \\ etc.) passam intactos
+        if caractere == "\\" and i + 1 < len(padrao):
+            partes.append(padrao[i : i + 2])
+            i += 2
+            continue
+        if classe:
+            classe = caractere != "]"
+        elif caractere == "[":
+            classe = True
+        elif caractere == "$":
+            partes.append(r"\r?$")
+            i += 1
+            continue
+        partes.append(caractere)
+        i += 1
+    return "".join(partes)
+
+
+def buscar_em_texto(texto: str, termo: re.Pattern) -> Generator[str, Any, None]:
+    """
+    Buscar um termo no texto completo de um arquivo.
+
+    A varredura é feita em uma única chamada ao motor de regex
+    (finditer) em vez de linha por linha, e a linha que contém cada
+    ocorrência é recuperada pelos limites de quebra de linha. É o
+    caminho usado quando o termo sai do ASCII e o casamento precisa
+    ser feito em str; o padrão deve vir compilado com re.MULTILINE
+    para manter as âncoras por linha.
+
+    Args:
+        texto (str): Texto completo a ser pesquisado.
+        termo (re.Pattern): Termo a ser pesquisado.
+
+    Yields:
+        str: Linha encontrada.
+    """
+    ultimo_fim = 0
+    for ocorrencia in termo.finditer(texto):
+        # Ignorar ocorrências repetidas na mesma linha
+        if ocorrencia.start() < ultimo_fim:
+            continue
+        inicio, fim = _limites_da_linha(texto, ocorrencia.start(), ocorrencia.end())
+        ultimo_fim = fim + 1
+        yield texto[inicio:fim].rstrip("\r")
+
+
+def buscar_em_dados(
+    dados: bytes | mmap.mmap, termo: re.Pattern[bytes]
+) -> Generator[str, Any, None]:
+    """
+    Buscar um termo em um conteúdo já carregado (ou mapeado) em memória.
+
+    O conteúdo é pesquisado como bytes, sem decodificação prévia:
+    apenas as linhas encontradas são decodificadas.
+
+    Args:
+        dados (bytes | mmap.mmap): Conteúdo a ser pesquisado.
+        termo (re.Pattern[bytes]): Termo a ser pesquisado, compilado como bytes.
+
+    Yields:
+        str: Linha encontrada.
+    """
+    ultimo_fim = 0
+    for ocorrencia in termo.finditer(dados):
+        # Ignorar ocorrências repetidas na mesma linha
+        if ocorrencia.start() < ultimo_fim:
+            continue
+        inicio, fim = _limites_da_linha(dados, ocorrencia.start(), ocorrencia.end())
+        ultimo_fim = fim + 1
+        yield dados[inicio:fim].rstrip(b"\r").decode("utf-8", errors="replace")
+
+
+def buscar_em_dados_literal(
+    dados: bytes | mmap.mmap, agulha: bytes, ignorecase: bool = False
+) -> Generator[str, Any, None]:
+    """
+    Buscar um termo literal em um conteúdo já carregado (ou mapeado) em memória.
+
+    Para termos literais o find (memmem em C, vetorizado pela libc) é
+    bem mais rápido que o motor de regex; após cada ocorrência a busca
+    continua na linha seguinte. Sem distinção de caixa, a tabela de
+    caixa é aplicada uma única vez sobre o conteúdo (bytes.lower, laço
+    em C) em vez de uma vez por comparação, e as linhas são recuperadas
+    do conteúdo original nos mesmos deslocamentos.
+
+    Args:
+        dados (bytes | mmap.mmap): Conteúdo a ser pesquisado.
+        agulha (bytes): Termo literal a ser pesquisado.
+        ignorecase (bool): Ignorar maiúsculas e minúsculas.
+
+    Yields:
+        str: Linha encontrada.
+    """
+    if ignorecase:
+        agulha = agulha.lower()
+        palheiro = dados.lower() if isinstance(dados, bytes) else bytes(dados).lower()
+    else:
+        palheiro = dados
+    # Evitar a busca de atributo por ocorrência
+    find = palheiro.find
+    pos = 0
+    while (i := find(agulha, pos)) != -1:
+        inicio, fim = _limites_da_linha(palheiro, i, i + len(agulha))
+        pos = fim + 1
+        yield dados[inicio:fim].rstrip(b"\r").decode("utf-8", errors="replace")
+
+
+def _literal_ancorado(termo: str) -> tuple[bytes, str] | None:
+    """
+    Detectar um padrão trivial ancorado (^literal ou literal$).
+
+    Padrões desse tipo não precisam do motor de regex: basta a busca
+    literal com uma validação da âncora contra a quebra de linha.
+
+    Args:
+        termo (str): Padrão informado pelo usuário.
+
+    Returns:
+        tuple[bytes, str] | None: Agulha e âncora ("inicio" ou "fim"),
+            ou None quando o padrão não é um literal ancorado.
+    """
+    if ocorrencia := re.fullmatch(r"\^([^\\\[\](){}.*+?|^$]+)", termo):
+        return ocorrencia.group(1).encode("utf-8"), "inicio"
+    if ocorrencia := re.fullmatch(r"([^\\\[\](){}.*+?|^$]+)\$", termo):
+        return ocorrencia.group(1).encode("utf-8"), "fim"
+    return None
+
+
+def buscar_em_dados_ancorado(
+    dados: bytes | mmap.mmap, agulha: bytes, ancora: str, ignorecase: bool = False
+) -> Generator[str, Any, None]:
+    """
+    Buscar um literal ancorado ao início ou ao fim da linha.
+
+    A busca usa o find literal e valida a âncora comparando um único
+    byte com a quebra de linha, sem entrar no motor de regex.
+
+    Args:
+        dados (bytes | mmap.mmap): Conteúdo a ser pesquisado.
+        agulha (bytes): Termo literal a ser pesquisado.
+        ancora (str): Posição da âncora ("inicio" ou "fim").
+        ignorecase (bool): Ignorar maiúsculas e minúsculas.
+
+    Yields:
+        str: Linha encontrada.
+    """
+    if ignorecase:
+        agulha = agulha.lower()
+        palheiro = dados.lower() if isinstance(dados, bytes) else bytes(dados).lower()
+    else:
+        palheiro = dados
+    # Evitar a busca de atributo por ocorrência
+    find = palheiro.find
+    tamanho = len(palheiro)
+    pos = 0
+    while (i := find(agulha, pos)) != -1:
+        fim_agulha = i + len(agulha)
+        if ancora == "inicio":
+            valido = i == 0 or palheiro[i - 1] == 10  # 10 == b"\n"
+        elif fim_agulha == tamanho or palheiro[fim_agulha] == 10:
+            valido = True
+        else:
+            # Quebra CRLF: aceitar o \r imediatamente antes do \n (13 == b"\r")
+            valido = palheiro[fim_agulha] == 13 and (
+                fim_agulha + 1 == tamanho or palheiro[fim_agulha + 1] == 10
+            )
+        if not valido:
+            pos = i + 1
+            continue
+        inicio, fim = _limites_da_linha(palheiro, i, fim_agulha)
+        pos = fim + 1
+        yield dados[inicio:fim].rstrip(b"\r").decode("utf-8", errors="replace")
+
+
+@contextmanager
+def _mapear(arquivo: str) -> Generator[mmap.mmap, Any, None]:
+    """
+    Abrir e mapear um arquivo para leitura sequencial.
+
+    Avisa o kernel que o acesso será sequencial (posix_fadvise e
+    madvise), o que torna o readahead mais agressivo e permite liberar
+    mais cedo as páginas já pesquisadas.
+
+    Args:
+        arquivo (str): Caminho para o arquivo.
+
+    Yields:
+        mmap.mmap: Mapeamento somente leitura do arquivo.
+    """
+    with open(arquivo, "rb") as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        # Arquivos vazios não podem ser mapeados (e não têm resultados)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield mm
+
+
+def buscar_em_arquivo(arquivo: str, termo: re.Pattern[bytes]) -> Generator[str, Any, None]:
+    """
+    Buscar um termo em um arquivo mapeado em memória.
+
+    O arquivo é mapeado com mmap e pesquisado como bytes, sem copiar
+    nem decodificar o conteúdo inteiro: apenas as linhas encontradas
+    são decodificadas.
+
+    Args:
+        arquivo (str): Caminho para o arquivo.
+        termo (re.Pattern[bytes]): Termo a ser pesquisado, compilado como bytes.
+
+    Yields:
+        str: Linha encontrada.
+    """
+    try:
+        with _mapear(arquivo) as mm:
+            yield from buscar_em_dados(mm, termo=termo)
+    except (OSError, ValueError):
+        return
+
+
+def buscar_em_arquivo_texto(arquivo: str, termo: re.Pattern) -> Generator[str, Any, None]:
+    """
+    Buscar um termo no conteúdo decodificado de um arquivo.
+
+    Caminho usado quando o termo sai do ASCII: o casamento precisa ser
+    feito em str para que o case folding Unicode e as classes de
+    caracteres multibyte funcionem como na busca linha por linha.
+
+    Args:
+        arquivo (str): Caminho para o arquivo.
+        termo (re.Pattern): Termo a ser pesquisado, compilado como str.
+
+    Yields:
+        str: Linha encontrada.
+    """
+    try:
+        with open(arquivo, "r", encoding="utf-8", errors="replace") as f:
+            texto = f.read()
+    except OSError:
+        return
+    yield from buscar_em_texto(texto, termo=termo)
+
+
+def buscar_em_arquivo_blocos(
+    arquivo: str, termo: re.Pattern[bytes], tamanho_bloco: int = 1 << 20
+) -> Generator[str, Any, None]:
+    """
+    Buscar um termo lendo o arquivo em blocos de tamanho fixo.
+
+    Apenas um bloco e o resto de linha parcial ficam em memória por
+    vez: cada bloco é pesquisado até a última quebra de linha completa
+    e o pedaço final é carregado para o bloco seguinte, para que
+    nenhuma linha seja cortada ao meio.
+
+    Args:
+        arquivo (str): Caminho para o arquivo.
+        termo (re.Pattern[bytes]): Termo a ser pesquisado, compilado como bytes.
+        tamanho_bloco (int): Tamanho de leitura em bytes (padrão: 1 MiB).
+
+    Yields:
+        str: Linha encontrada.
+    """
+    try:
+        with open(arquivo, "rb") as f:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            resto = b""
+            while bloco := f.read(tamanho_bloco):
+                dados = resto + bloco
+                corte = dados.rfind(b"\n")
+                # Linha maior que o bloco: acumular e continuar lendo
+                if corte == -1:
+                    resto = dados
+                    continue
+                resto = dados[corte + 1 :]
+                ultimo_fim = 0
+                for ocorrencia in termo.finditer(dados, 0, corte + 1):
+                    # Ignorar ocorrências repetidas na mesma linha
+                    if ocorrencia.start() < ultimo_fim:
+                        continue
+                    inicio = dados.rfind(b"\n", 0, ocorrencia.start()) + 1
+                    fim = dados.find(b"\n", ocorrencia.end())
+                    if fim == -1:
+                        fim = corte
+                    ultimo_fim = fim + 1
+                    yield dados[inicio:fim].rstrip(b"\r").decode("utf-8", errors="replace")
+            # Última linha, sem quebra de linha final
+            if resto and termo.search(resto):
+                yield resto.rstrip(b"\r").decode("utf-8", errors="replace")
+    except OSError:
+        return
+
+
+def buscar_em_arquivo_texto_blocos(
+    arquivo: str, termo: re.Pattern, tamanho_bloco: int = 1 << 20
+) -> Generator[str, Any, None]:
+    """
+    Buscar um termo em str lendo o arquivo em blocos de tamanho fixo.
+
+    Variante de buscar_em_arquivo_texto para o modo buffer: apenas um
+    bloco e o resto de linha parcial ficam em memória por vez. Cada
+    bloco é cortado na última quebra de linha completa antes de ser
+    decodificado, então nenhum caractere multibyte é partido ao meio, e
+    as quebras são normalizadas como no modo texto.
+
+    Args:
+        arquivo (str): Caminho para o arquivo.
+        termo (re.Pattern): Termo a ser pesquisado, compilado como str.
+        tamanho_bloco (int): Tamanho de leitura em bytes (padrão: 1 MiB).
+
+    Yields:
+        str: Linha encontrada.
+    """
+    try:
+        with open(arquivo, "rb") as f:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            resto = b""
+            while bloco := f.read(tamanho_bloco):
+                dados = resto + bloco
+                corte = dados.rfind(b"\n")
+                # Linha maior que o bloco: acumular e continuar lendo
+                if corte == -1:
+                    resto = dados
+                    continue
+                resto = dados[corte + 1 :]
+                texto = (
+                    dados[: corte + 1]
+                    .decode("utf-8", errors="replace")
+                    .replace("\r\n", "\n")
+                    .replace("\r", "\n")
+                )
+                yield from buscar_em_texto(texto, termo=termo)
+            # Última linha, sem quebra de linha final
+            if resto:
+                texto = (
+                    resto.decode("utf-8", errors="replace")
+                    .replace("\r\n", "\n")
+                    .replace("\r", "\n")
+                )
+                yield from buscar_em_texto(texto, termo=termo)
+    except OSError:
+        return
+
+
+def buscar_em_arquivo_literal(
+    arquivo: str, agulha: bytes, ignorecase: bool = False
+) -> Generator[str, Any, None]:
+    """
+    Buscar um termo literal em um arquivo mapeado em memória.
+
+    Para termos literais o mm.find (memmem em C, vetorizado pela libc)
+    é bem mais rápido que o motor de regex; após cada ocorrência a
+    busca continua na linha seguinte.
+
+    Args:
+        arquivo (str): Caminho para o arquivo.
+        agulha (bytes): Termo literal a ser pesquisado.
+        ignorecase (bool): Ignorar maiúsculas e minúsculas.
+
+    Yields:
+        str: Linha encontrada.
+    """
+    try:
+        with _mapear(arquivo) as mm:
+            yield from buscar_em_dados_literal(mm, agulha=agulha, ignorecase=ignorecase)
+    except (OSError, ValueError):
+        return
+
+
+def buscar_em_arquivo_ancorado(
+    arquivo: str, agulha: bytes, ancora: str, ignorecase: bool = False
+) -> Generator[str, Any, None]:
+    """
+    Buscar um literal ancorado em um arquivo mapeado em memória.
+
+    Args:
+        arquivo (str): Caminho para o arquivo.
+        agulha (bytes): Termo literal a ser pesquisado.
+        ancora (str): Posição da âncora ("inicio" ou "fim").
+        ignorecase (bool): Ignorar maiúsculas e minúsculas.
+
+    Yields:
+        str: Linha encontrada.
+    """
+    try:
+        with _mapear(arquivo) as mm:
+            yield from buscar_em_dados_ancorado(
+                mm, agulha=agulha, ancora=ancora, ignorecase=ignorecase
+            )
+    except (OSError, ValueError):
+        return
+
+
+if numba is not None:
+
+    @numba.njit(cache=True, boundscheck=False)
+    def _escanear_literal_numba(dados, agulha):
+        limites = []
+        i = 0
+        n = dados.size
+        m = agulha.size
+        while i <= n - m:
+            igual = True
+            for j in range(m):
+                if dados[i + j] != agulha[j]:
+                    igual = False
+                    break
+            if igual:
+                inicio = i
+                while inicio > 0 and dados[inicio - 1] != 10:
+                    inicio -= 1
+                fim = i + m
+                while fim < n and dados[fim] != 10:
+                    fim += 1
+                limites.append((inicio, fim))
+                i = fim + 1
+            else:
+                i += 1
+        return limites
+
+
+def buscar_em_arquivo_numba(
+    arquivo: str, agulha: bytes, ignorecase: bool
+) -> Generator[str, Any, None]:
+    """
+    Buscar um termo literal com um laço compilado pelo Numba.
+
+    O mapeamento é visto como um vetor numpy de bytes e o laço interno
+    (comparação e limites de linha) roda em código de máquina gerado
+    pelo LLVM, sem o interpretador no caminho quente.
+
+    Args:
+        arquivo (str): Caminho para o arquivo.
+        agulha (bytes): Termo literal a ser pesquisado.
+        ignorecase (bool): Ignorar maiúsculas e minúsculas.
+
+    Yields:
+        str: Linha encontrada.
+    """
+    if ignorecase:
+        agulha = agulha.lower()
+    try:
+        with _mapear(arquivo) as mm:
+            if ignorecase:
+                dados = np.frombuffer(bytes(mm).lower(), dtype=np.uint8)
+            else:
+                dados = np.frombuffer(mm, dtype=np.uint8)
+            vetor_agulha = np.frombuffer(agulha, dtype=np.uint8)
+            for inicio, fim in _escanear_literal_numba(dados, vetor_agulha):
+                yield mm[inicio:fim].rstrip(b"\r").decode("utf-8", errors="replace")
+    except (OSError, ValueError):
+        return
+
+
+def compilar_hyperscan(expressao: bytes, ignorecase: bool) -> Any:
+    """
+    Compilar uma expressão em um banco Hyperscan.
+
+    Args:
+        expressao (bytes): Expressão a ser compilada.
+        ignorecase (bool): Ignorar maiúsculas e minúsculas.
+
+    Returns:
+        hyperscan.Database: Banco compilado.
+    """
+    banco = hyperscan.Database()
+    banco.compile(
+        expressions=[expressao],
+        ids=[0],
+        flags=[hyperscan.HS_FLAG_CASELESS if ignorecase else 0],
+    )
+    return banco
+
+
+def buscar_em_arquivo_hyperscan(arquivo: str, banco: Any) -> Generator[str, Any, None]:
+    """
+    Buscar um termo em um arquivo mapeado em memória usando Hyperscan.
+
+    O Hyperscan varre o mapeamento com um autômato vetorizado (SIMD) e
+    reporta o deslocamento final de cada ocorrência; a linha é
+    recuperada pelos limites de quebra de linha, como no caminho re.
+
+    Args:
+        arquivo (str): Caminho para o arquivo.
+        banco (hyperscan.Database): Banco compilado com o termo.
+
+    Yields:
+        str: Linha encontrada.
+    """
+    try:
+        with _mapear(arquivo) as mm:
+            fins: list[int] = []
+            banco.scan(
+                mm,
+                match_event_handler=lambda _id, _de, ate, _flags, _ctx: fins.append(
+                    ate
+                ),
+            )
+            ultimo_fim = 0
+            for ate in fins:
+                # Ignorar ocorrências repetidas na mesma linha
+                if ate <= ultimo_fim:
+                    continue
+                inicio, fim = _limites_da_linha(mm, ate, ate)
+                ultimo_fim = fim + 1
+                yield mm[inicio:fim].rstrip(b"\r").decode("utf-8", errors="replace")
+    except (OSError, ValueError):
+        return
+
+
+def escanear_arquivo(
+    arquivo: str, termo: str, flags: int, regex: bool, engine: str, buffer: bool
+) -> list[str]:
+    """
+    Escanear um único arquivo e retornar as linhas encontradas.
+
+    Função de nível de módulo para poder ser executada em processos
+    trabalhadores; o termo é recompilado dentro do processo (objetos
+    re.Pattern e bancos Hyperscan não são serializáveis) e todo o
+    estado chega por parâmetro — com o método spawn os globais do
+    processo principal não existem nos trabalhadores.
+
+    Args:
+        arquivo (str): Caminho para o arquivo.
+        termo (str): Termo de busca original.
+        flags (int): Flags de compilação do re.
+        regex (bool): Tratar o termo como expressão regular.
+        engine (str): Motor de busca (re, hyperscan ou numba).
+        buffer (bool): Ler em blocos de tamanho fixo em vez de mapear.
+
+    Returns:
+        list[str]: Linhas encontradas.
+    """
+    if engine == "numba":
+        return list(
+            buscar_em_arquivo_numba(
+                arquivo,
+                agulha=termo.encode("utf-8"),
+                ignorecase=bool(flags & re.IGNORECASE),
+            )
+        )
+    if engine == "hyperscan":
+        expressao = (re.escape(termo) if not regex else termo).encode("utf-8")
+        chave = (expressao, bool(flags & re.IGNORECASE))
+        banco = _BANCOS_HYPERSCAN.get(chave)
+        if banco is None:
+            banco = _BANCOS_HYPERSCAN[chave] = compilar_hyperscan(
+                expressao, ignorecase=chave[1]
+            )
+        return list(buscar_em_arquivo_hyperscan(arquivo, banco=banco))
+    # O caminho literal ignora caixa com bytes.lower, que só conhece
+    # ASCII: agulhas fora do ASCII seguem para o casamento em str
+    literal_ok = termo.isascii() or not flags & re.IGNORECASE
+    if not regex and not buffer and literal_ok:
+        return list(
+            buscar_em_arquivo_literal(
+                arquivo,
+                agulha=termo.encode("utf-8"),
+                ignorecase=bool(flags & re.IGNORECASE),
+            )
+        )
+    # Padrões triviais ancorados também dispensam o motor de regex. No
+    # modo buffer eles seguem pelo caminho genérico em blocos, que com
+    # _tolerar_crlf aceita os mesmos finais de linha: -b não muda quais
+    # linhas são encontradas
+    if regex and not buffer and literal_ok and (ancorado := _literal_ancorado(termo)):
+        agulha, ancora = ancorado
+        return list(
+            buscar_em_arquivo_ancorado(
+                arquivo,
+                agulha=agulha,
+                ancora=ancora,
+                ignorecase=bool(flags & re.IGNORECASE),
+            )
+        )
+    padrao = re.escape(termo) if not regex else termo
+    # Termos fora do ASCII exigem o casamento em str: o re sobre bytes
+    # não aplica case folding Unicode e classes como [áé] viram bytes soltos
+    if not termo.isascii():
+        termo_str = re.compile(_tolerar_crlf(padrao), flags=flags | re.MULTILINE)
+        # No modo buffer a variante em blocos mantém a memória limitada
+        if buffer:
+            return list(buscar_em_arquivo_texto_blocos(arquivo, termo=termo_str))
+        return list(buscar_em_arquivo_texto(arquivo, termo=termo_str))
+    # Versão em bytes do termo (o conteúdo é pesquisado sem decodificar).
+    # MULTILINE preserva o sentido por linha das âncoras ^ e $ agora que
+    # o conteúdo inteiro é pesquisado de uma vez
+    termo_bytes = re.compile(
+        _tolerar_crlf(padrao).encode("utf-8"), flags=flags | re.MULTILINE
+    )
+    # No modo buffer a leitura é feita em blocos de tamanho fixo, em vez
+    # de mapear o arquivo inteiro
+    if buffer:
+        return list(buscar_em_arquivo_blocos(arquivo, termo=termo_bytes))
+    return list(buscar_em_arquivo(arquivo, termo=termo_bytes))
+
+
+def _ler_antecipado(arquivos: list[str]) -> Generator[bytes, Any, None]:
+    """
+    Ler arquivos com uma thread produtora, adiantada em relação ao consumo.
+
+    Enquanto a thread principal pesquisa o conteúdo de um arquivo, a
+    thread de leitura já carrega o próximo (a leitura em disco solta a
+    GIL), sobrepondo E/S e varredura. A fila curta limita a leitura a
+    um arquivo à frente.
+
+    Args:
+        arquivos (list[str]): Lista de arquivos a serem lidos.
+
+    Yields:
+        bytes: Conteúdo de um arquivo.
+    """
+    fila: queue.Queue[bytes | None] = queue.Queue(maxsize=2)
+
+    def _produtor() -> None:
+        for arquivo in arquivos:
+            try:
+                with open(arquivo, "rb") as f:
+                    if hasattr(os, "posix_fadvise"):
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    dados = f.read()
+            except OSError:
+                continue
+            fila.put(dados)
+        fila.put(None)
+
+    thread = threading.Thread(target=_produtor, daemon=True)
+    thread.start()
+    while (dados := fila.get()) is not None:
+        yield dados
+    thread.join()
+
+
+def gerar_resultados(
+    arquivos: list[str], termo: str, flags: int, regex: bool, engine: str
+) -> Generator[str, Any, None]:
+    """
+    Gerar as linhas encontradas em todos os arquivos.
+
+    No modo verboso a leitura é feita linha por linha para permitir o
+    acompanhamento; caso contrário cada arquivo é escaneado em bloco
+    pelo motor selecionado.
+
+    Args:
+        arquivos (list[str]): Lista de arquivos a serem pesquisados.
+        termo (str): Termo de busca original.
+        flags (int): Flags de compilação do re.
+        regex (bool): Tratar o termo como expressão regular.
+        engine (str): Motor de busca (re, hyperscan ou numba).
+
+    Yields:
+        str: Linha encontrada.
+    """
+    if VERBOSO:
+        padrao = re.compile(re.escape(termo) if not regex else termo, flags=flags)
+        search = padrao.search  # Evitar a busca de atributo por linha
+        for arquivo in arquivos:
+            for linha in ler_arquivo(arquivo):
+                if linha is None:
+                    continue
+                elif search(linha):
+                    _print(f"Encontrado na linha: {linha}")
+                    yield linha
+    # Com vários arquivos no motor re, uma thread de leitura carrega o
+    # próximo arquivo enquanto este é pesquisado
+    elif engine == "re" and not BUFFER and len(arquivos) > 1:
+        ignorecase = bool(flags & re.IGNORECASE)
+        # bytes.lower só conhece ASCII: agulhas fora do ASCII seguem
+        # para o casamento em str
+        literal_ok = termo.isascii() or not ignorecase
+        if not regex and literal_ok:
+            agulha = termo.encode("utf-8")
+            for dados in _ler_antecipado(arquivos):
+                yield from buscar_em_dados_literal(
+                    dados, agulha=agulha, ignorecase=ignorecase
+                )
+        elif regex and literal_ok and (ancorado := _literal_ancorado(termo)):
+            agulha, ancora = ancorado
+            for dados in _ler_antecipado(arquivos):
+                yield from buscar_em_dados_ancorado(
+                    dados, agulha=agulha, ancora=ancora, ignorecase=ignorecase
+                )
+        elif termo.isascii():
+            # MULTILINE: âncoras ^ e $ por linha na varredura do conteúdo inteiro
+            termo_bytes = re.compile(
+                _tolerar_crlf(termo).encode("utf-8"), flags=flags | re.MULTILINE
+            )
+            for dados in _ler_antecipado(arquivos):
+                yield from buscar_em_dados(dados, termo=termo_bytes)
+        else:
+            # Termos fora do ASCII exigem o casamento em str (case folding
+            # Unicode e classes de caracteres multibyte)
+            padrao = re.escape(termo) if not regex else termo
+            termo_str = re.compile(_tolerar_crlf(padrao), flags=flags | re.MULTILINE)
+            for dados in _ler_antecipado(arquivos):
+                # Normalizar as quebras como o modo texto (universal
+                # newlines) faz em buscar_em_arquivo_texto, para que os
+                # dois caminhos str casem as mesmas linhas
+                texto = (
+                    dados.decode("utf-8", errors="replace")
+                    .replace("\r\n", "\n")
+                    .replace("\r", "\n")
+                )
+                yield from buscar_em_texto(texto, termo=termo_str)
+    else:
+        for arquivo in arquivos:
+            yield from escanear_arquivo(
+                arquivo,
+                termo=termo,
+                flags=flags,
+                regex=regex,
+                engine=engine,
+                buffer=BUFFER,
+            )
+
+
+def gerar_resultados_paralelo(
+    arquivos: list[str],
+    termo: str,
+    flags: int,
+    regex: bool,
+    engine: str,
+    buffer: bool,
+    jobs: int,
+) -> Generator[str, Any, None]:
+    """
+    Gerar as linhas encontradas distribuindo os arquivos entre processos.
+
+    Cada arquivo é independente, então o conjunto é repartido entre os
+    processos trabalhadores e os resultados são emitidos na ordem dos
+    arquivos.
+
+    Args:
+        arquivos (list[str]): Lista de arquivos a serem pesquisados.
+        termo (str): Termo de busca original.
+        flags (int): Flags de compilação do re.
+        regex (bool): Tratar o termo como expressão regular.
+        engine (str): Motor de busca (re, hyperscan ou numba).
+        buffer (bool): Ler em blocos de tamanho fixo em vez de mapear.
+        jobs (int): Número de processos trabalhadores.
+
+    Yields:
+        str: Linha encontrada.
+    """
+    tamanho_lote = max(1, len(arquivos) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for parte in executor.map(
+            escanear_arquivo,
+            arquivos,
+            repeat(termo),
+            repeat(flags),
+            repeat(regex),
+            repeat(engine),
+            repeat(buffer),
+            chunksize=tamanho_lote,
+        ):
+            yield from parte
+
+
 # --- Main --- #
 def main() -> None:
     start_time = time.time()
 
     # Apresentação
-    ascii_art = pyfiglet.figlet_format("SearchCloud")
-    print(ascii_art)
+    print(BANNER)
 
     # Argumentos
     parser = argparse.ArgumentParser()
@@ -183,11 +1057,24 @@ def main() -> None:
         type=str,
         help="Salvar resultados em um arquivo",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        default=os.cpu_count() or 1,
+        type=int,
+        help="Número de processos de busca em paralelo (padrão: núcleos da CPU)",
+    )
+    parser.add_argument(
+        "--engine",
+        default="re",
+        choices=["re", "hyperscan", "numba"],
+        help="Motor de busca (hyperscan e numba requerem pacotes opcionais. padrão: re)",
+    )
     parser.add_argument(
         "-b",
         "--buffer",
         action="store_true",
-        help="Usar buffer (carregar em memória todos os arquivos. padrão: False)",
+        help="Ler os arquivos em blocos de 1 MiB com memória limitada, em vez de mapeá-los inteiros (padrão: False)",
     )
     parser.add_argument(
         "-v",
@@ -213,49 +1100,57 @@ def main() -> None:
 
     # Buscando termo
     _flags = re.IGNORECASE if args.ignorecase else 0
-    _termo = (
-        re.compile(re.escape(args.termo), flags=_flags)
-        if not args.regex
-        else re.compile(args.termo, flags=_flags)
-    )
+
+    # Motores de busca opcionais
+    if args.engine == "hyperscan" and hyperscan is None:
+        print("Motor hyperscan indisponível. Instale com: pip install hyperscan")
+        return None
+    if args.engine == "numba":
+        if numba is None:
+            print("Motor numba indisponível. Instale com: pip install numba numpy")
+            return None
+        if args.regex:
+            print("Motor numba suporta apenas busca literal (sem --regex)")
+            return None
+
+    # Execução paralela quando há vários arquivos (o modo verboso é sequencial)
+    if args.jobs > 1 and not VERBOSO and len(arquivos) > 1:
+        resultados = gerar_resultados_paralelo(
+            arquivos,
+            termo=args.termo,
+            flags=_flags,
+            regex=args.regex,
+            engine=args.engine,
+            buffer=args.buffer,
+            jobs=args.jobs,
+        )
+    else:
+        resultados = gerar_resultados(
+            arquivos,
+            termo=args.termo,
+            flags=_flags,
+            regex=args.regex,
+            engine=args.engine,
+        )
 
     # Devolver resultados
     total_resultados = 0
     if args.salvar:
-        # Gravando tudo na memória
-        if BUFFER:
-            LINHAS = []
-            for arquivo in arquivos:
-                for linha in ler_arquivo(arquivo):
-                    if linha is None:
-                        continue
-                    elif linha_valida := buscar_termo(linha, termo=_termo):
-                        LINHAS.append(linha_valida)
-            total_resultados = len(LINHAS)
-            if total_resultados > 0:
-                with open(args.salvar, mode="w", encoding="utf-8") as arquivo:
-                    arquivo.write("\n".join(LINHAS))
-        # Gravando com buffer automatico
-        else:
-            with open(args.salvar, mode="w", encoding="utf-8") as arquivo:
-                for arquivo_analise in arquivos:
-                    for linha in ler_arquivo(arquivo_analise):
-                        if linha is None:
-                            continue
-                        elif linha_valida := buscar_termo(linha, termo=_termo):
-                            total_resultados += 1
-                            arquivo.write(linha_valida + "\n")
+        # Gravando em fluxo: cada linha é escrita assim que é encontrada,
+        # sem acumular tudo na memória
+        with open(
+            args.salvar, mode="w", encoding="utf-8", buffering=1 << 20
+        ) as arquivo:
+            for linha_valida in resultados:
+                total_resultados += 1
+                arquivo.write(linha_valida + "\n")
         print(f"Resultados salvo em: {args.salvar}")
     else:
-        for arquivo in arquivos:
-            for linha in ler_arquivo(arquivo):
-                if linha is None:
-                    continue
-                elif buscar_termo(linha, termo=_termo):
-                    total_resultados += 1
+        for _ in resultados:
+            total_resultados += 1
         print("Use -s para salvar os resultados")
     print(f"Total de linhas encontradas: {total_resultados}")
 
     # Mostrar tempo de execução
     end_time = time.time()
-    print(f"Tempo de execução: {formatar_duracao(end_time - start_time)}")
+    print(f"Tempo de execução: {timedelta(seconds=int(end_time - start_time))}")
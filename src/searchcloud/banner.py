@@ -0,0 +1,9 @@
+# Arte gerada uma única vez com pyfiglet.figlet_format("SearchCloud"),
+# para não pagar o custo de carregar e renderizar a fonte a cada execução
+BANNER = r""" ____                      _      ____ _                 _ 
+/ ___|  ___  __ _ _ __ ___| |__  / ___| | ___  _   _  __| |
+\___ \ / _ \/ _` | '__/ __| '_ \| |   | |/ _ \| | | |/ _` |
+ ___) |  __/ (_| | | | (__| | | | |___| | (_) | |_| | (_| |
+|____/ \___|\__,_|_|  \___|_| |_|\____|_|\___/ \__,_|\__,_|
+                                                           
+"""